@@ -12,10 +12,113 @@ Many modules you will not need to interact with directly, these are named with a
 
 """
 
-from PIL import Image
+import os
+import re
+from collections.abc import Mapping
+from contextlib import contextmanager
+from copy import deepcopy
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import count
+from weakref import WeakKeyDictionary, WeakValueDictionary, ref
+
 from pptx import Presentation
 from pptx.enum.shapes import PP_PLACEHOLDER_TYPE
-from pptx.slide import Slide
+from pptx.opc.packuri import PackURI
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import namespaces, nsdecls
+from pptx.slide import Slide, SlideLayout
+
+# Placeholder structure of each slide layout, see _get_layout_placeholders()
+_layout_placeholder_cache = WeakKeyDictionary()
+
+# Slide layout names mapped to index and layout for each presentation, see _get_slide_layout_idx()
+_layout_name_cache = WeakKeyDictionary()
+
+# Function adding slides from each slide layout, see _get_slide_factory()
+_slide_factory_cache = WeakKeyDictionary()
+
+# Image part added for each picture file in each presentation, see _cached_image_parts()
+_image_part_cache = WeakKeyDictionary()
+
+# Path from a shape tree to the <p:ph> element of each placeholder shape in it
+_PH_PATH = "./*/*/p:nvPr/p:ph"
+_PH_NAMESPACES = namespaces("p")
+
+# Placeholder type XML values mapped to their group, see _group_placeholders()
+_PLACEHOLDER_GROUPS = {
+    PP_PLACEHOLDER_TYPE.TITLE.xml_value: "title",
+    PP_PLACEHOLDER_TYPE.BODY.xml_value: "body",
+    PP_PLACEHOLDER_TYPE.PICTURE.xml_value: "picture",
+}
+
+# Placeholder types not copied from a layout onto a new slide, see _get_layout_placeholders()
+_NON_CLONEABLE_TYPES = {
+    PP_PLACEHOLDER_TYPE.DATE.xml_value,
+    PP_PLACEHOLDER_TYPE.FOOTER.xml_value,
+    PP_PLACEHOLDER_TYPE.SLIDE_NUMBER.xml_value,
+}
+
+# Paragraphs copied for each line of text, see _set_placeholder_text()
+_TEXT_PARAGRAPH = parse_xml(f"<a:p {nsdecls('a')}><a:r><a:t/></a:r></a:p>")
+_EMPTY_PARAGRAPH = parse_xml(f"<a:p {nsdecls('a')}/>")
+
+# Control characters, which python-pptx escapes or turns into line breaks
+_CONTROL_CHARS = re.compile(r"[\x00-\x08\x0B-\x1F]")
+
+
+class _PlaceholderMap(Mapping):
+    """
+    Placeholder indices on a slide, grouped into title, body, picture and other. Returned by
+    get_slide_placeholders().
+
+    Read the groups as attributes, e.g. placeholders.body. This is a __slots__ class rather than a
+    dict, as one is made for every slide, and attribute reads are quicker than dict lookups.
+    It is a read-only Mapping of the group names, so it can still be used like the dict this
+    returned previously, e.g. placeholders["body"], .items(), or dict(placeholders) for JSON.
+
+    Attributes:
+        title: Index of the title placeholder, or "" if there is none.
+        body: List of body placeholder indices.
+        picture: List of picture placeholder indices.
+        other: Index of each other placeholder mapped to its type.
+    """
+
+    __slots__ = ("title", "body", "picture", "other")
+
+    def __init__(self):
+        self.title = ""
+        self.body = []
+        self.picture = []
+        self.other = {}
+
+    def __getitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self):
+        return len(self.__slots__)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+@dataclass
+class SlideSpec:
+    """
+    Describes one slide for add_slides_bulk. The fields are the arguments of add_slide with the
+    same names, and have the same defaults.
+    """
+
+    layout_name: str
+    title: str = ""
+    bodies: list = None
+    pictures: list = None
+    picture_scale_method: str = "fill_placeholder"
 
 
 def get_all_slide_layouts(prs: Presentation):
@@ -39,7 +142,7 @@ def get_all_slide_layouts(prs: Presentation):
 
 def get_slide_placeholders(slide: Slide):
     """
-    Provides a dictionary breakdown of the placeholders available on a given slide.
+    Provides a breakdown of the placeholders available on a given slide.
 
     This slidepack generator works by adding content into pre-defined placeholders. A placeholder
     is effectively the empty content spaces you see when clicking 'New Slide'. This method allows
@@ -50,7 +153,9 @@ def get_slide_placeholders(slide: Slide):
         slide: Slide in pptx from which to find placeholders.
 
     Returns:
-        dict: Placeholders indices, grouped into title, body, picture and other.
+        _PlaceholderMap: Placeholders indices, grouped into title, body, picture and other
+            attributes. Body and picture indices are in ascending order, which is the order
+            add_slide fills them in.
 
 
     Examples:
@@ -60,6 +165,7 @@ def get_slide_placeholders(slide: Slide):
 
         Example output, for a slide layout with a title and two pictures
         {'title': 0, 'body':[], 'picture': [7,8], 'other':{}}
+        placeholders.picture gives [7,8]
 
 
     Notes:
@@ -73,30 +179,105 @@ def get_slide_placeholders(slide: Slide):
         https://python-pptx.readthedocs.io/en/latest/api/shapes.html
     """
 
-    slide_placeholders = {"title": "", "body": [], "picture": [], "other": {}}
+    return _group_placeholders(_iter_ph_elements(slide))
 
-    # Loop through shapes
-    for shape in slide.shapes:
-        if shape.is_placeholder:
-            phf = shape.placeholder_format
 
-            if phf.type == PP_PLACEHOLDER_TYPE.TITLE:
-                slide_placeholders["title"] = int(phf.idx)
-            elif phf.type == PP_PLACEHOLDER_TYPE.BODY:
-                slide_placeholders["body"].append(int(phf.idx))
-            elif phf.type == PP_PLACEHOLDER_TYPE.PICTURE:
-                slide_placeholders["picture"].append(int(phf.idx))
-            else:
-                slide_placeholders["other"][phf.idx] = str(phf.type)
+def _iter_ph_elements(slide):
+    """
+    Returns an iterator over the <p:ph> element of each placeholder shape on a slide or layout, in
+    the order the shapes appear. Designed for use in other methods in this module, and may not be
+    useful directly.
 
-    # Shapes are ordered in reverse of the UI (i.e. starting from the bottom)
-    # reverse it here so it goes from top-to-bottom
-    slide_placeholders["body"].reverse()
-    slide_placeholders["picture"].reverse()
+    Searching the XML directly avoids creating a python-pptx shape object, and checking whether
+    it is a placeholder, for every shape on the slide.
+
+    Args:
+        slide: Slide or slide layout in pptx from which to find placeholders.
+    """
+    return slide.shapes._spTree.iterfind(_PH_PATH, _PH_NAMESPACES)
+
+
+def _group_placeholders(ph_elements):
+    """
+    Groups placeholders into the structure returned by get_slide_placeholders(). Designed for
+    use in other methods in this module, and may not be useful directly.
+
+    Args:
+        ph_elements: Iterable of <p:ph> elements, in the order their shapes appear on the slide.
+
+    Returns:
+        _PlaceholderMap: Placeholders indices, grouped into title, body, picture and other.
+    """
+
+    slide_placeholders = _PlaceholderMap()
+
+    # Loop through placeholders
+    for ph in ph_elements:
+        # Attribute defaults are those of the OOXML schema
+        idx = int(ph.get("idx", 0))
+        ph_type = ph.get("type", PP_PLACEHOLDER_TYPE.OBJECT.xml_value)
+
+        group = _PLACEHOLDER_GROUPS.get(ph_type)
+        if group is None:
+            slide_placeholders.other[idx] = str(PP_PLACEHOLDER_TYPE.from_xml(ph_type))
+        elif group == "title":
+            slide_placeholders.title = idx
+        else:
+            getattr(slide_placeholders, group).append(idx)
+
+    # Order by placeholder index, rather than relying on the order of the shapes
+    slide_placeholders.body.sort()
+    slide_placeholders.picture.sort()
 
     return slide_placeholders
 
 
+def _get_slide_placeholder_shapes(slide: Slide):
+    """
+    Returns the placeholder shapes on a slide, mapped from their index. Designed for use in other
+    methods in this module, and may not be useful directly.
+
+    Each slide.placeholders[idx] lookup searches all shapes on the slide, so when several
+    placeholders are needed they are collected here in a single pass instead.
+
+    Args:
+        slide: Slide in pptx from which to find placeholders.
+
+    Returns:
+        dict: Placeholder index mapped to placeholder shape
+    """
+    return {int(shape.placeholder_format.idx): shape for shape in slide.placeholders}
+
+
+def _get_layout_placeholders(layout: SlideLayout):
+    """
+    Returns the placeholder structure of a slide created from the given layout. Designed for use
+    in other methods in this module, and may not be useful directly.
+
+    A new slide is given a copy of each placeholder on its layout (except date, footer and slide
+    number), so the structure is the same for every slide created from that layout. It is worked
+    out once per layout and cached, as add_slide may be called many times with the same layout.
+    The returned structure is shared between calls and must not be modified.
+
+    Args:
+        layout: Slide layout from which the slide is, or will be, created.
+
+    Returns:
+        _PlaceholderMap: Placeholders indices, grouped into title, body, picture and other.
+    """
+    # Keyed by layout part, as the layout proxy object itself is not hashable
+    placeholders = _layout_placeholder_cache.get(layout.part)
+    if placeholders is None:
+        placeholders = _group_placeholders(
+            ph
+            for ph in _iter_ph_elements(layout)
+            if ph.get("type") not in _NON_CLONEABLE_TYPES
+        )
+        _layout_placeholder_cache[layout.part] = placeholders
+
+    return placeholders
+
+
 def _get_slide_layout_idx(prs: Presentation, layout_name: str):
     """
     Returns the index of a layout in a presentation. Designed for use in other methods in this module,
@@ -113,11 +294,32 @@ def _get_slide_layout_idx(prs: Presentation, layout_name: str):
 
     Returns:
         int: The index of slide_layout
+
+    Raises:
+        KeyError: If the presentation has no slide layout named layout_name.
+
+    Notes:
+        The layout names are read once per presentation and cached. The cached layout is checked
+        each time, and the names are read again if layouts have been removed, renamed or moved.
     """
+    slide_layouts = prs.slide_layouts
+
+    # Keyed by presentation part, as the Presentation object itself is not hashable. The layout
+    # parts are held weakly, as each one refers back to the presentation.
+    num_layouts, map_name_layout = _layout_name_cache.get(prs.part, (None, {}))
+    if num_layouts == len(slide_layouts) and layout_name in map_name_layout:
+        layout_idx, layout_part = map_name_layout[layout_name]
+        layout = slide_layouts[layout_idx]
+        if layout.part is layout_part() and layout.name == layout_name:
+            return layout_idx
 
-    map_idx_slidelayout = get_all_slide_layouts(prs)
+    map_name_layout = {
+        name: (idx, ref(slide_layouts[idx].part))
+        for name, idx in get_all_slide_layouts(prs).items()
+    }
+    _layout_name_cache[prs.part] = (len(slide_layouts), map_name_layout)
 
-    return map_idx_slidelayout[layout_name]
+    return map_name_layout[layout_name][0]
 
 
 def _calc_max_image_height_within_placeholder(
@@ -151,25 +353,209 @@ def _calc_max_image_height_within_placeholder(
     placeholder_width = placeholder_size[0]
     placeholder_height = placeholder_size[1]
 
-    width_scale_factor = placeholder_width / img_width
-    height_scale_factor = placeholder_height / img_height
+    # The smaller of the width and height scale factors limits the image size. Compare them by
+    # cross-multiplying, so that only integer arithmetic is used and the limiting side is exact.
+    # placeholder_height / img_height <= placeholder_width / img_width
+    if placeholder_height * img_width <= placeholder_width * img_height:
+        output_width = img_width * placeholder_height // img_height
+        output_height = placeholder_height
+    else:
+        output_width = placeholder_width
+        output_height = img_height * placeholder_width // img_width
+
+    return (int(output_width), int(output_height))
+
+
+@lru_cache(maxsize=256)
+def _image_size(picture: str, mtime: float):
+    """
+    Returns the (width, height) of an image file in px. Designed for use in other methods in this
+    module, and may not be useful directly.
+
+    The same picture (e.g. a logo) is often placed on many slides, so sizes are cached. The file's
+    modification time is part of the cache key, so an image rewritten between calls is re-read.
+
+    Args:
+        picture: Picture filepath as string.
+        mtime: Modification time of the picture file, from os.path.getmtime().
+
+    Returns:
+        (int, int): (width, height) Size of the image in px
+    """
+    # PIL is only needed here, for 'within_placeholder' pictures, so is imported on first use
+    from PIL import Image
+
+    # Only the header is read to get the size, the file is closed straight after
+    with Image.open(picture) as img:
+        return img.size
+
+
+def _set_placeholder_text(placeholder, text: str):
+    """
+    Updates a placeholder to contain the given text, one paragraph per line. Designed for use in
+    other methods in this module, and may not be useful directly.
+
+    Gives the same result as placeholder.text = text, but builds each paragraph by copying a
+    prepared paragraph element rather than through the python-pptx text frame API, which is
+    slower. Text containing control characters (e.g. the vertical tab python-pptx uses for line
+    breaks) is still set through python-pptx, which handles these specially.
+
+    Args:
+        placeholder: Placeholder shape on slide to update.
+        text: Text to place in the placeholder. Each line feed starts a new paragraph.
+    """
+    if _CONTROL_CHARS.search(text):
+        placeholder.text = text
+        return
+
+    txBody = placeholder.text_frame._txBody
+    txBody.clear_content()
+    for line in text.split("\n"):
+        # As in python-pptx, an empty line is a paragraph with no runs
+        if line:
+            p = deepcopy(_TEXT_PARAGRAPH)
+            p[0][0].text = line
+        else:
+            p = deepcopy(_EMPTY_PARAGRAPH)
+        txBody.append(p)
+
 
-    # Get the actual scale factor - which is the smallest of these
-    scale_factor = min(width_scale_factor, height_scale_factor)
-    output_width = int(img_width * scale_factor)
-    output_height = int(img_height * scale_factor)
+def _get_image_size(picture):
+    """
+    Returns the (width, height) of a picture in px. Designed for use in other methods in this
+    module, and may not be useful directly.
+
+    Sizes of picture files are cached, see _image_size(). File-like objects are read each time,
+    and left at the position they were at.
+
+    Args:
+        picture: Picture filepath, or file-like object containing the picture.
+
+    Returns:
+        (int, int): (width, height) Size of the image in px
+    """
+    if isinstance(picture, (str, os.PathLike)):
+        return _image_size(picture, os.path.getmtime(picture))
 
-    return (output_width, output_height)
+    from PIL import Image
+
+    position = picture.tell()
+    with Image.open(picture) as img:
+        img_size = img.size
+    picture.seek(position)
+
+    return img_size
+
+
+def _remove_placeholder_shape(placeholder):
+    """Updates slide object by removing a placeholder shape"""
+    element = placeholder._element
+    element.getparent().remove(element)
+
+
+def _fast_image_partnames(package):
+    """
+    Returns a function naming new image parts of a package from a counter. Designed for use in
+    _image_part_options(), and may not be useful directly.
+
+    By default python-pptx finds the next free image partname (e.g. /ppt/media/image3.png) by
+    walking every part in the package, so each picture added to a large deck is slower than the
+    last. Instead, walk the package once and count up from the highest image number in use.
+
+    Args:
+        package: The package of the presentation, i.e. prs.part.package
+
+    Returns:
+        function: Taking a file extension (e.g. 'png') and returning the next image partname.
+    """
+    image_idxs = [
+        part.partname.idx
+        for part in package.iter_parts()
+        if part.partname.startswith("/ppt/media/image") and part.partname.idx is not None
+    ]
+    next_image_idx = count(max(image_idxs, default=0) + 1)
 
+    def next_image_partname(ext: str):
+        return PackURI("/ppt/media/image%d.%s" % (next(next_image_idx), ext))
 
-def _remove_placeholder_from_slide(slide: Slide, placeholder_idx: int):
-    """Updates slide object by removing a placeholder"""
-    shape = slide.placeholders[placeholder_idx]
-    shape = shape._element
-    shape.getparent().remove(shape)
+    return next_image_partname
 
 
-def _add_picture_within_placeholder(slide: Slide, placeholder_idx: int, picture: str):
+def _cached_image_parts(prs: Presentation):
+    """
+    Returns a function getting the image part of a picture file, reusing the part added for the
+    same file before. Designed for use in _image_part_options(), and may not be useful directly.
+
+    python-pptx already stores each distinct image once, but to find out whether an image is
+    already stored it reads and hashes the whole file, then walks every part in the package.
+    The same picture (e.g. a logo) is often placed on many slides, so remember the image part
+    added for each file, keyed by its path, modification time and size.
+
+    Args:
+        prs: The presentation the pictures are added to.
+
+    Returns:
+        function: Taking a picture filepath or file-like object and returning its image part.
+    """
+    package = prs.part.package
+    get_or_add_image_part = package.get_or_add_image_part
+
+    # Keyed by presentation part, as the Presentation object itself is not hashable. The parts
+    # are held weakly, as each one refers back to the package.
+    image_parts = _image_part_cache.get(prs.part)
+    if image_parts is None:
+        image_parts = _image_part_cache[prs.part] = WeakValueDictionary()
+
+    def get_or_add_cached_image_part(image_file):
+        # File-like objects can't be identified without reading them, so leave to python-pptx
+        if not isinstance(image_file, str):
+            return get_or_add_image_part(image_file)
+
+        stat = os.stat(image_file)
+        key = (os.path.abspath(image_file), stat.st_mtime_ns, stat.st_size)
+        image_part = image_parts.get(key)
+        if image_part is None:
+            image_part = get_or_add_image_part(image_file)
+            image_parts[key] = image_part
+
+        return image_part
+
+    return get_or_add_cached_image_part
+
+
+@contextmanager
+def _image_part_options(
+    prs: Presentation, fast_partnames=False, cache_image_parts=False
+):
+    """
+    Context manager applying the fast_partnames and cache_image_parts options of add_slide to a
+    presentation, for as long as the context is open. Designed for use in other methods in this
+    module, and may not be useful directly.
+
+    The options replace methods of the presentation's package, so that pictures added by
+    python-pptx use them. The original methods are restored on leaving the context, so pictures
+    added afterwards without the options (including with python-pptx directly) are unaffected.
+
+    Args:
+        prs: The presentation the pictures are added to.
+        fast_partnames, cache_image_parts: See add_slide.
+    """
+    package = prs.part.package
+    options = {}
+    if fast_partnames:
+        options["next_image_partname"] = _fast_image_partnames(package)
+    if cache_image_parts:
+        options["get_or_add_image_part"] = _cached_image_parts(prs)
+
+    vars(package).update(options)
+    try:
+        yield
+    finally:
+        for name in options:
+            del vars(package)[name]
+
+
+def _add_picture_within_placeholder(slide: Slide, placeholder, picture):
     """
     Updates slide to have a picture in the position of a defined placeholder, without cropping.
     Designed for use in other methods in this module, and may not be useful directly.
@@ -179,23 +565,23 @@ def _add_picture_within_placeholder(slide: Slide, placeholder_idx: int, picture:
     No returns. Changes are made to slide.
 
     Args:
-        slide: Slide in pptx from which to find the picture placeholder.
-        placeholder_idx: Index of the picture placeholder in slide.
-        picture: Picture filepath as string.
+        slide: Slide in pptx containing the picture placeholder.
+        placeholder: Picture placeholder shape on slide, e.g. from _get_slide_placeholder_shapes().
+        picture: Picture filepath as string, or file-like object containing the picture.
 
     Notes:
         The limitation of the pptx insert_picture method, which this method overcomes,
         is outlined here- https://python-pptx.readthedocs.io/en/latest/user/
                         placeholders-using.html#pictureplaceholder-insert-picture
     """
-    placeholder_left = slide.placeholders[placeholder_idx].left
-    placeholder_top = slide.placeholders[placeholder_idx].top
+    placeholder_left = placeholder.left
+    placeholder_top = placeholder.top
 
-    placeholder_width = slide.placeholders[placeholder_idx].width
-    placeholder_height = slide.placeholders[placeholder_idx].height
+    placeholder_width = placeholder.width
+    placeholder_height = placeholder.height
     placeholder_size = (placeholder_width, placeholder_height)
 
-    img_size = Image.open(picture).size
+    img_size = _get_image_size(picture)
 
     # Calculate the size of the picture to be placed on slide
     output_size = _calc_max_image_height_within_placeholder(img_size, placeholder_size)
@@ -208,16 +594,18 @@ def _add_picture_within_placeholder(slide: Slide, placeholder_idx: int, picture:
         height=output_size[1],
     )
 
-    _remove_placeholder_from_slide(slide, placeholder_idx)
+    _remove_placeholder_shape(placeholder)
 
 
 def add_slide(
     prs: Presentation,
     layout_name: str,
     title="",
-    bodies=[],
-    pictures=[],
+    bodies=None,
+    pictures=None,
     picture_scale_method="fill_placeholder",
+    fast_partnames=False,
+    cache_image_parts=False,
 ):
     """
     Adds a slide to a presentation, using a pre-defined layout.
@@ -233,10 +621,10 @@ def add_slide(
         layout_name: The layout to use in creating a slide. If you are unsure about what
             the names of the layouts are, use get_all_slide_layouts() or see the notes below.
         title: Title for the page. Leave as a blank string if the page has no title placeholder
-        bodies: List of strings, one per text placeholder, in the order defined in Powerpoint Selection Pane
-            (see Notes).
-        pictures: List of local filepaths of PNGs. One for each picture placeholder, in the order defined in Powerpoint
-        Selection Pane (see Notes).
+        bodies: List of strings, one per text placeholder, in order of placeholder index
+            (see get_slide_placeholders). Defaults to no bodies.
+        pictures: List of local filepaths of PNGs. One for each picture placeholder, in order of placeholder index
+            (see get_slide_placeholders). Defaults to no pictures.
         picture_scale_method: {'fill_placeholder', 'within_placeholder'}
             In all three scaling methods, the aspect ratio is maintained. The differences
             are around cropping and defining the end of the image.
@@ -244,10 +632,25 @@ def add_slide(
             until the entire placeholder is filled. Some of the image may be cropped.
             - 'within_placeholder' will resize the image to be as large as possible, but
             staying entirely within the placeholder
+        fast_partnames: If True, search the presentation for a free image name once per call
+            and count up from it, rather than searching once per picture. Speeds up adding
+            slides with several pictures, or many slides with add_slides_bulk, to large decks.
+            Only applies during this call.
+        cache_image_parts: If True, remember the image added for each picture file, so a picture
+            used on many slides (e.g. a logo) is only read once for the presentation. The images
+            remembered are kept between calls with this set, but not used by calls without it.
+            A file is recognised by its path, modification time and size, so do not use this if
+            a picture file is overwritten between slides (e.g. a chart saved to the same
+            temporary file each time): on filesystems with coarse timestamps, a rewrite of the
+            same size would reuse the previous picture.
 
     Returns:
         slide_idx: Integer representing the slide index. Retain for use in a contents page or similar
 
+    Raises:
+        TypeError: If title is not a string, or bodies or pictures is a single string.
+        ValueError: If the inputs don't fit the placeholders of the layout (see Notes).
+
     Notes:
         This method requires the following:
         - A non-empty Title string is provided ONLY if there is a title placeholder.
@@ -255,6 +658,8 @@ def add_slide(
         - Bodies must contain no more strings than there are placeholders for bodies.
         - Pictures must be empty if there are no placeholders for pictures
         - Pictures must contain no more strings than there are placeholders for pictures.
+        These are checked by validate_layout_inputs. To check them once for many slides with the
+        same layout, call it directly and then add each slide with add_slide_unchecked.
 
 
     Example:
@@ -266,80 +671,328 @@ def add_slide(
 
     """
 
-    assert (
-        type(title) == str
-    ), "Ensure title is string (empty string if no Title Placeholder exists)"
+    layout_idx = validate_layout_inputs(prs, layout_name, title, bodies, pictures)
+
+    return add_slide_unchecked(
+        prs,
+        layout_idx,
+        title,
+        bodies,
+        pictures,
+        picture_scale_method,
+        fast_partnames,
+        cache_image_parts,
+    )
+
+
+def validate_layout_inputs(
+    prs: Presentation, layout_name: str, title="", bodies=None, pictures=None
+):
+    """
+    Checks that a title, bodies and pictures fit the placeholders of a slide layout, without
+    adding a slide.
+
+    add_slide runs these checks for every slide. When adding many slides with the same layout
+    and the same kind of inputs, call this once and then add_slide_unchecked for each slide.
+
+    Args:
+        prs: The presentation being used as a template.
+        layout_name: The layout to check against. See add_slide.
+        title, bodies, pictures: See add_slide.
 
-    # Get slide
+    Returns:
+        int: The index of the layout, to pass to add_slide_unchecked.
+
+    Raises:
+        TypeError: If title is not a string, or bodies or pictures is a single string.
+        ValueError: If the inputs don't fit the placeholders of the layout (see add_slide Notes).
+    """
     layout_idx = _get_slide_layout_idx(prs, layout_name)
-    slide = prs.slides.add_slide(prs.slide_layouts[layout_idx])
+    placeholders = _get_layout_placeholders(prs.slide_layouts[layout_idx])
+    _check_slide_inputs(placeholders, title, bodies, pictures)
+
+    return layout_idx
+
+
+def add_slide_unchecked(
+    prs: Presentation,
+    layout_idx: int,
+    title="",
+    bodies=None,
+    pictures=None,
+    picture_scale_method="fill_placeholder",
+    fast_partnames=False,
+    cache_image_parts=False,
+):
+    """
+    Adds a slide to a presentation as add_slide does, but without checking the inputs.
 
-    # Get all place holders on slide
-    placeholders = get_slide_placeholders(slide)
+    Only use this with inputs already checked by validate_layout_inputs. Inputs that don't fit
+    the layout are not reported: extra bodies or pictures, or a title with no placeholder, are
+    silently left out.
+
+    Args:
+        prs: The presentation being used as a template (including any front pages to retain).
+        layout_idx: The index of the layout to use, as returned by validate_layout_inputs.
+        title, bodies, pictures, picture_scale_method, fast_partnames, cache_image_parts: See
+            add_slide.
+
+    Returns:
+        slide_idx: Integer representing the slide index. Retain for use in a contents page or similar
+
+    Example:
+        pres = Presentation('filename.pptx')
+        layout_idx = validate_layout_inputs(pres, 'title_2txt', 'Title', ['text1', 'text2'])
+        for title, bodies in content:
+            add_slide_unchecked(pres, layout_idx, title, bodies)
+        pres.save('output_file.pptx')
+    """
+    with _image_part_options(prs, fast_partnames, cache_image_parts):
+        return _add_slide_to_layout(
+            prs,
+            prs.slide_layouts[layout_idx],
+            title,
+            bodies,
+            pictures,
+            picture_scale_method,
+        )
+
+
+def add_slides_bulk(
+    prs: Presentation, slides, fast_partnames=False, cache_image_parts=False
+):
+    """
+    Adds many slides to a presentation, each using a pre-defined layout.
+
+    Gives the same result as calling add_slide once per SlideSpec, in the same order, but the
+    work that depends only on the layout (finding it by name, finding its placeholders) is done
+    once per layout rather than once per slide. Use this when generating large slidepacks.
+
+    Args:
+        prs: The presentation being used as a template (including any front pages to retain).
+        slides: Iterable (e.g. list) of SlideSpec, one per slide to add, in the order they should
+            appear.
+        fast_partnames, cache_image_parts: See add_slide.
+
+    Returns:
+        list: Integers representing the slide index of each slide added, in the order of slides.
+
+    Raises:
+        TypeError, ValueError: As for add_slide, for the first SlideSpec that fails its checks.
+            Every SlideSpec is checked before any slide is added, so no slides are added.
+
+    Example:
+        pres = Presentation('filename.pptx')
+        slide_idxs = add_slides_bulk(pres, [
+            SlideSpec("title_only", title="Contents"),
+            SlideSpec("title_2txt", title="Summary", bodies=["text1", "text2"]),
+        ])
+        pres.save('output_file.pptx')
+    """
+
+    # Slides may be given as any iterable, including a generator, which can only be read once
+    slides = list(slides)
 
     # CHECK INPUTS
+    # Check every spec before adding any slide, so a bad spec leaves the deck unchanged
+    layouts = []
+    layouts_by_name = {}
+    for spec in slides:
+        layout = layouts_by_name.get(spec.layout_name)
+        if layout is None:
+            layout_idx = _get_slide_layout_idx(prs, spec.layout_name)
+            layout = layouts_by_name[spec.layout_name] = prs.slide_layouts[layout_idx]
+
+        _check_slide_inputs(
+            _get_layout_placeholders(layout), spec.title, spec.bodies, spec.pictures
+        )
+        layouts.append(layout)
+
+    # ADD SLIDES
+    slide_idxs = []
+    with _image_part_options(prs, fast_partnames, cache_image_parts):
+        for spec, layout in zip(slides, layouts):
+            slide_idxs.append(
+                _add_slide_to_layout(
+                    prs,
+                    layout,
+                    spec.title,
+                    spec.bodies,
+                    spec.pictures,
+                    spec.picture_scale_method,
+                )
+            )
+
+    return slide_idxs
+
+
+def _add_slide_to_layout(
+    prs: Presentation,
+    layout: SlideLayout,
+    title: str,
+    bodies,
+    pictures,
+    picture_scale_method: str,
+):
+    """
+    Adds and populates a slide from a layout, without checking the inputs. Designed for use in
+    add_slide_unchecked and add_slides_bulk, and may not be useful directly. See add_slide for
+    details of the arguments.
+
+    Returns:
+        slide_idx: Integer representing the slide index.
+    """
+    slide_factory = _get_slide_factory(layout)
+
+    return slide_factory(prs, layout, title, bodies, pictures, picture_scale_method)
+
+
+def _check_slide_inputs(placeholders: _PlaceholderMap, title: str, bodies, pictures):
+    """
+    Raises an error if the inputs for a slide don't fit its placeholders. Designed for use in
+    other methods in this module, and may not be useful directly. See validate_layout_inputs.
+
+    Args:
+        placeholders: Placeholder structure of the layout, from _get_layout_placeholders().
+        title, bodies, pictures: See add_slide.
+    """
+
+    # None means no bodies or pictures, see add_slide
+    if bodies is None:
+        bodies = ()
+    if pictures is None:
+        pictures = ()
+
+    # Raised explicitly rather than with assert, so the checks still run under python -O
+    if not isinstance(title, str):
+        raise TypeError(
+            "Ensure title is string (empty string if no Title Placeholder exists)"
+        )
+    # A single string would otherwise be treated as a list of characters
+    if isinstance(bodies, str):
+        raise TypeError("Ensure bodies is a list of strings, not a string")
+    if isinstance(pictures, str):
+        raise TypeError("Ensure pictures is a list of filepaths, not a string")
+
     # TITLE
     # Ensure no title is provided iff there is no placeholder
-    if placeholders["title"] == "":
-        assert title == "", "Title provided but no title placeholder exists"
+    if placeholders.title == "" and title != "":
+        raise ValueError("Title provided but no title placeholder exists")
 
     # BODY
     # Ensure there are no more input bodies than there are body placeholders
-    num_body_placeholders = len(placeholders["body"])
+    num_body_placeholders = len(placeholders.body)
     num_bodies = len(bodies)
-    assert (
-        num_bodies <= num_body_placeholders
-    ), f"Body: {num_bodies} strings provided, {num_body_placeholders} placeholders exist."
+    if num_bodies > num_body_placeholders:
+        raise ValueError(
+            f"Body: {num_bodies} strings provided, {num_body_placeholders} placeholders exist."
+        )
 
     # PICTURE
     # Ensure there are no more input pictures than there are picture placeholders
-    num_pic_placeholders = len(placeholders["picture"])
+    num_pic_placeholders = len(placeholders.picture)
     num_pictures = len(pictures)
-    assert (
-        num_pictures <= num_pic_placeholders
-    ), f"Pictures: {num_pictures} provided, but {num_pic_placeholders} placeholders exists."
+    if num_pictures > num_pic_placeholders:
+        raise ValueError(
+            f"Pictures: {num_pictures} provided, but {num_pic_placeholders} placeholders exists."
+        )
 
-    # UPDATE SLIDE
 
-    # Update Title
-    if placeholders["title"] != "":
-        if title != "":
-            slide_title = slide.shapes.title
-            slide_title.text = title
-        else:
-            _remove_placeholder_from_slide(slide, placeholders["title"])
+def _get_slide_factory(layout: SlideLayout):
+    """
+    Returns the function that adds slides from the given layout, see _compile_slide_factory().
+    Designed for use in other methods in this module, and may not be useful directly.
 
-    # Update Body
-    # Loop through placeholders
-    for i, placeholder_idx in enumerate(placeholders["body"]):
-        # If a string exists in body, use it to update the placeholder text
-        if i < num_bodies:
-            body_placeholder = slide.placeholders[placeholder_idx]
-            body_placeholder.text = bodies[i]
+    The function is compiled once per layout and cached.
 
-        # else remove the placeholder
-        else:
-            _remove_placeholder_from_slide(slide, placeholder_idx)
+    Args:
+        layout: Slide layout from which slides will be created.
 
-    # Update Picture
-    # Loop through placeholders
-    for i, placeholder_idx in enumerate(placeholders["picture"]):
-        # If a picture filepath exists, use it to insert a picture into the placeholder
-        if i < num_pictures:
+    Returns:
+        function: See _compile_slide_factory()
+    """
+    # Keyed by layout part, as the layout proxy object itself is not hashable
+    slide_factory = _slide_factory_cache.get(layout.part)
+    if slide_factory is None:
+        slide_factory = _compile_slide_factory(_get_layout_placeholders(layout))
+        _slide_factory_cache[layout.part] = slide_factory
+
+    return slide_factory
+
+
+def _compile_slide_factory(placeholders: _PlaceholderMap):
+    """
+    Returns a function that adds and populates a slide with the given placeholder structure.
+    Designed for use in other methods in this module, and may not be useful directly.
 
-            picture = pictures[i]
+    Everything that depends only on the layout (which placeholders exist, and how many) is worked
+    out here once, leaving the returned function only the work specific to each slide.
+
+    Args:
+        placeholders: Placeholder structure of the layout, from _get_layout_placeholders().
+
+    Returns:
+        function: (prs, layout, title, bodies, pictures, picture_scale_method) -> slide_idx
+            See add_slide for details of the arguments, which are not checked, see
+            _check_slide_inputs(). The function keeps no reference to the layout, so that it can
+            be cached against it.
+    """
+    title_idx = placeholders.title
+    has_title = title_idx != ""
+    body_idxs = tuple(placeholders.body)
+    picture_idxs = tuple(placeholders.picture)
+
+    # The slide's shapes are only needed if there are placeholders to fill or remove
+    has_placeholders = has_title or body_idxs or picture_idxs
+
+    def slide_factory(prs, layout, title, bodies, pictures, picture_scale_method):
+        # None means no bodies or pictures, see add_slide
+        if bodies is None:
+            bodies = ()
+        if pictures is None:
+            pictures = ()
+
+        num_bodies = len(bodies)
+        num_pictures = len(pictures)
+
+        # UPDATE SLIDE
+        slide = prs.slides.add_slide(layout)
+        if not has_placeholders:
+            return slide.slide_id
+
+        placeholder_shapes = _get_slide_placeholder_shapes(slide)
+
+        # Update Title
+        if has_title:
+            if title != "":
+                _set_placeholder_text(placeholder_shapes[title_idx], title)
+            else:
+                _remove_placeholder_shape(placeholder_shapes[title_idx])
+
+        # Update Body
+        # Use each string in bodies to update the text of a placeholder
+        for placeholder_idx, body in zip(body_idxs, bodies):
+            _set_placeholder_text(placeholder_shapes[placeholder_idx], body)
+
+        # Remove the placeholders left without a body
+        for placeholder_idx in body_idxs[num_bodies:]:
+            _remove_placeholder_shape(placeholder_shapes[placeholder_idx])
+
+        # Update Picture
+        # Use each picture filepath to insert a picture into a placeholder
+        for placeholder_idx, picture in zip(picture_idxs, pictures):
+            placeholder = placeholder_shapes[placeholder_idx]  # idx key, not position
 
             if picture_scale_method == "fill_placeholder":
-                placeholder = slide.placeholders[
-                    placeholder_idx
-                ]  # idx key, not position
                 placeholder.insert_picture(picture)
 
             elif picture_scale_method == "within_placeholder":
-                _add_picture_within_placeholder(slide, placeholder_idx, picture)
+                _add_picture_within_placeholder(slide, placeholder, picture)
 
-        # Else remove the placeholder
-        else:
-            _remove_placeholder_from_slide(slide, placeholder_idx)
+        # Remove the placeholders left without a picture
+        for placeholder_idx in picture_idxs[num_pictures:]:
+            _remove_placeholder_shape(placeholder_shapes[placeholder_idx])
+
+        return slide.slide_id
 
-    return slide.slide_id
+    return slide_factory
@@ -8,9 +8,13 @@ slide layouts with known placeholders and structures to test against.
 
 import sys
 import os
+import io
+import json
 import pytest
 from pptx import Presentation
 from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from lxml import etree
 from PIL import Image
 
 import slidepack_generator as sg
@@ -58,6 +62,35 @@ def test_get_slide_layout_idx_returns_int(get_prs):
     assert type(slide_layout_idx) == int
 
 
+# Must return the same index as get_all_slide_layouts, including on repeat calls
+def test_get_slide_layout_idx_matches_all_slide_layouts(get_prs):
+    for _ in range(2):
+        for name, idx in sg.get_all_slide_layouts(get_prs).items():
+            assert sg._get_slide_layout_idx(get_prs, name) == idx
+
+
+
+# Must follow layouts being removed or renamed after the names were cached
+def test_get_slide_layout_idx_after_layout_changes(get_prs):
+    layout_names = list(sg.get_all_slide_layouts(get_prs))
+    for name in layout_names:
+        sg._get_slide_layout_idx(get_prs, name)
+
+    # Layouts after the removed one move up an index
+    get_prs.slide_layouts.remove(get_prs.slide_layouts.get_by_name("title_only"))
+    with pytest.raises(KeyError):
+        sg._get_slide_layout_idx(get_prs, "title_only")
+    for name in layout_names:
+        if name != "title_only":
+            layout_idx = sg._get_slide_layout_idx(get_prs, name)
+            assert get_prs.slide_layouts[layout_idx].name == name
+
+    get_prs.slide_layouts.get_by_name("title_2txt")._element.cSld.name = "renamed"
+    with pytest.raises(KeyError):
+        sg._get_slide_layout_idx(get_prs, "title_2txt")
+    assert sg._get_slide_layout_idx(get_prs, "renamed") == 1
+
+
 # METHOD get_slide_placeholders ##
 
 # Must have same structure when empty
@@ -70,6 +103,30 @@ def test_get_slide_placeholders(get_prs):
     assert placeholders == expected_structure
 
 
+# Must still support reading as a dict
+def test_get_slide_placeholders_dict_access(get_prs):
+    slide = get_prs.slides.add_slide(get_prs.slide_layouts[2])
+    placeholders = sg.get_slide_placeholders(slide)
+
+    assert placeholders["title"] == placeholders.title == 0
+    assert placeholders["body"] == placeholders.body == [15, 16]
+    assert "picture" in placeholders
+    assert placeholders.get("body") == [15, 16]
+    assert placeholders == {"title": 0, "body": [15, 16], "picture": [], "other": {}}
+    with pytest.raises(KeyError):
+        placeholders["missing"]
+
+    assert list(placeholders) == ["title", "body", "picture", "other"]
+    assert len(placeholders) == 4
+    assert dict(placeholders) == dict(placeholders.items())
+    assert json.loads(json.dumps(dict(placeholders))) == {
+        "title": 0,
+        "body": [15, 16],
+        "picture": [],
+        "other": {},
+    }
+
+
 # Must have same sub-structure when some placeholders exist
 def test_get_slide_placeholders_title_2pic_3txt(get_prs):
     idx_title_2pic_3txt = 3  # can be identified using sg._get_slide_layout_idx()
@@ -82,6 +139,15 @@ def test_get_slide_placeholders_title_2pic_3txt(get_prs):
     assert len(placeholders["other"]) == 0
 
 
+# Body and picture placeholders must be in order of index
+def test_get_slide_placeholders_ordered_by_idx(get_prs):
+    slide = get_prs.slides.add_slide(get_prs.slide_layouts[3])
+    placeholders = sg.get_slide_placeholders(slide)
+
+    assert placeholders["body"] == [15, 16, 17]
+    assert placeholders["picture"] == [13, 14]
+
+
 # Must have same sub-structure when other content exists
 def test_get_slide_placeholders_other_placeholders(get_prs):
     idx_other_placeholders = 4  # can be identified using sg._get_slide_layout_idx()
@@ -92,6 +158,50 @@ def test_get_slide_placeholders_other_placeholders(get_prs):
     assert len(placeholders["picture"]) == 0
     assert len(placeholders["body"]) == 0
     assert len(placeholders["other"]) == 1
+    assert placeholders["other"] == {13: "MEDIA_CLIP (10)"}
+
+
+## METHOD _get_slide_placeholder_shapes ##
+# Must map each placeholder index to its shape
+def test_get_slide_placeholder_shapes(get_prs):
+    slide = get_prs.slides.add_slide(get_prs.slide_layouts[3])
+    placeholder_shapes = sg._get_slide_placeholder_shapes(slide)
+
+    assert sorted(placeholder_shapes) == [0, 13, 14, 15, 16, 17]
+    for idx, shape in placeholder_shapes.items():
+        assert shape.placeholder_format.idx == idx
+
+
+## METHOD _get_layout_placeholders ##
+# Must match the placeholders found on a new slide from that layout
+def test_get_layout_placeholders_matches_new_slide(get_prs):
+    for layout in get_prs.slide_layouts:
+        slide = get_prs.slides.add_slide(layout)
+        assert sg._get_layout_placeholders(layout) == sg.get_slide_placeholders(slide)
+
+
+# Must be cached per layout
+def test_get_layout_placeholders_cached(get_prs):
+    layout = get_prs.slide_layouts[3]
+    assert sg._get_layout_placeholders(layout) is sg._get_layout_placeholders(layout)
+
+
+## METHOD _remove_placeholder_shape ##
+def test_remove_placeholder_shape(get_prs):
+    slide = get_prs.slides.add_slide(get_prs.slide_layouts[2])
+    sg._remove_placeholder_shape(slide.placeholders[15])
+
+    assert sg.get_slide_placeholders(slide)["body"] == [16]
+
+
+## METHOD _get_slide_factory ##
+# Must be compiled once per layout
+def test_get_slide_factory_cached(get_prs):
+    layout = get_prs.slide_layouts[2]
+    assert sg._get_slide_factory(layout) is sg._get_slide_factory(layout)
+    assert sg._get_slide_factory(layout) is not sg._get_slide_factory(
+        get_prs.slide_layouts[3]
+    )
 
 
 ## METHOD add_picture_within_placeholder
@@ -107,7 +217,9 @@ def test_add_picure_within_placeholder(get_prs):
     remove_idx = pre_idxs[0]
 
     # Method being tested
-    sg._add_picture_within_placeholder(slide, remove_idx, sample_img_fname)
+    sg._add_picture_within_placeholder(
+        slide, slide.placeholders[remove_idx], sample_img_fname
+    )
 
     # Get placeholder indexes before method
     post_placeholders = sg.get_slide_placeholders(slide)
@@ -118,6 +230,61 @@ def test_add_picure_within_placeholder(get_prs):
     assert new_idx not in pre_placeholders
 
 
+def test_image_size():
+    mtime = os.path.getmtime(sample_img_fname)
+    with Image.open(sample_img_fname) as img:
+        assert sg._image_size(sample_img_fname, mtime) == img.size
+
+
+## METHOD _set_placeholder_text ##
+# Must give the same XML as setting text through python-pptx
+@pytest.mark.parametrize(
+    "text", ["", "some text", "line1\nline2", "line1\n\nline3\n", "soft\vbreak", "bell\x07"]
+)
+def test_set_placeholder_text_matches_pptx(get_prs, text):
+    layout = get_prs.slide_layouts[2]
+    expected_slide = get_prs.slides.add_slide(layout)
+    slide = get_prs.slides.add_slide(layout)
+
+    expected_placeholder = expected_slide.placeholders[15]
+    expected_placeholder.text = text
+    placeholder = slide.placeholders[15]
+    sg._set_placeholder_text(placeholder, text)
+
+    assert placeholder.text == expected_placeholder.text
+    assert etree.tostring(placeholder._element.txBody) == etree.tostring(
+        expected_placeholder._element.txBody
+    )
+
+
+# File-like pictures must be read without the cache, and left where they were
+def test_get_image_size_file_like():
+    with open(sample_img_fname, "rb") as f:
+        picture = io.BytesIO(f.read())
+    with Image.open(sample_img_fname) as img:
+        assert sg._get_image_size(picture) == img.size
+    assert picture.tell() == 0
+
+
+# File-like pictures must be accepted with 'within_placeholder'
+def test_add_slide_within_placeholder_file_like(get_prs):
+    with open(sample_img_fname, "rb") as f:
+        picture = io.BytesIO(f.read())
+
+    slide_idx = sg.add_slide(
+        prs=get_prs,
+        layout_name="title_2pic_3txt",
+        title="Some Title",
+        pictures=[picture],
+        picture_scale_method="within_placeholder",
+    )
+    slide = get_prs.slides.get(slide_idx)
+    num_pics = sum(
+        [shape.shape_type == MSO_SHAPE_TYPE.PICTURE for shape in slide.shapes]
+    )
+    assert num_pics == 1
+
+
 def test_calc_max_image_height_within_placeholder():
     img_size = (1000, 500)  # width, height in px
     image = Image.new("RGB", img_size)
@@ -143,6 +310,10 @@ def test_calc_max_image_height_within_placeholder():
     )
     assert output_size == (4000, 2000)
 
+    # docstring examples
+    assert sg._calc_max_image_height_within_placeholder((10, 40), (40, 80)) == (20, 80)
+    assert sg._calc_max_image_height_within_placeholder((10, 40), (40, 400)) == (40, 160)
+
 
 ## FUNCTION add_slide ##
 
@@ -155,7 +326,7 @@ def test_title_not_accepted_not_provided(get_prs):
 
 # No placeholder, must throw error if title provided
 def test_title_not_accepted_but_provided(get_prs):
-    with pytest.raises(AssertionError):
+    with pytest.raises(ValueError):
         sg.add_slide(
             prs=get_prs, layout_name="no_placeholders", title="Some Title Text"
         )
@@ -169,6 +340,12 @@ def test_title_accepted_and_provided(get_prs):
     assert type(slide_idx) == int
 
 
+# Title given as non-string must fail
+def test_title_given_as_non_string(get_prs):
+    with pytest.raises(TypeError):
+        sg.add_slide(prs=get_prs, layout_name="title_only", title=None)
+
+
 ## BODY / TEXT
 # No placeholder, must allow empty body to be provided
 def test_body_not_accepted_not_provided(get_prs):
@@ -180,7 +357,7 @@ def test_body_not_accepted_not_provided(get_prs):
 
 # No placeholder, must throw error if body provided
 def test_body_not_accepted_but_provided(get_prs):
-    with pytest.raises(AssertionError):
+    with pytest.raises(ValueError):
         sg.add_slide(
             prs=get_prs,
             layout_name="title_only",
@@ -200,9 +377,18 @@ def test_body_accepted_and_provided(get_prs):
     assert type(slide_idx) == int
 
 
+# Bodies must fill placeholders in order of index
+def test_body_fills_lowest_idx_first(get_prs):
+    slide_idx = sg.add_slide(
+        prs=get_prs, layout_name="title_2txt", title="Some Title", bodies=["text1"]
+    )
+    slide = get_prs.slides.get(slide_idx)
+    assert slide.placeholders[15].text == "text1"
+
+
 # Arg given as string must fail
 def test_body_accepted_given_as_string(get_prs):
-    with pytest.raises(AssertionError):
+    with pytest.raises(TypeError):
         sg.add_slide(
             prs=get_prs,
             layout_name="title_2txt",
@@ -213,7 +399,7 @@ def test_body_accepted_given_as_string(get_prs):
 
 # Placeholder(s) exist, but fail as too many bodies provided
 def test_body_accepted_too_many_provided(get_prs):
-    with pytest.raises(AssertionError):
+    with pytest.raises(ValueError):
         sg.add_slide(
             prs=get_prs,
             layout_name="title_2txt",
@@ -222,6 +408,16 @@ def test_body_accepted_too_many_provided(get_prs):
         )
 
 
+# Bodies and pictures must default to none, removing their placeholders
+def test_bodies_pictures_default_to_empty(get_prs):
+    slide_idx = sg.add_slide(
+        prs=get_prs, layout_name="title_2pic_3txt", title="Some Title"
+    )
+    placeholders = sg.get_slide_placeholders(get_prs.slides.get(slide_idx))
+    assert placeholders["body"] == []
+    assert placeholders["picture"] == []
+
+
 ## PICTURES
 # No placeholder, must allow empty picture to be provided
 def test_picture_not_accepted_not_provided(get_prs):
@@ -233,7 +429,7 @@ def test_picture_not_accepted_not_provided(get_prs):
 
 # No placeholder, must throw error if picture provided
 def test_body_not_accepted_but_provided(get_prs):
-    with pytest.raises(AssertionError):
+    with pytest.raises(ValueError):
         sg.add_slide(
             prs=get_prs,
             layout_name="title_only",
@@ -255,7 +451,7 @@ def test_picture_accepted_and_provided(get_prs):
 
 # Arg given as string must fail
 def test_picture_accepted_given_as_string(get_prs):
-    with pytest.raises(AssertionError):
+    with pytest.raises(TypeError):
         sg.add_slide(
             prs=get_prs,
             layout_name="title_2pic_3txt",
@@ -266,7 +462,7 @@ def test_picture_accepted_given_as_string(get_prs):
 
 # Placeholder(s) exist, but fail as too many pictures provided
 def test_picture_accepted_too_many_provided(get_prs):
-    with pytest.raises(AssertionError):
+    with pytest.raises(ValueError):
         sg.add_slide(
             prs=get_prs,
             layout_name="title_2pic_3txt",
@@ -319,3 +515,264 @@ def test_add_slide_within_placeholder_result(get_prs):
         [shape.shape_type == MSO_SHAPE_TYPE.PICTURE for shape in slide.shapes]
     )
     assert num_pics == 1
+
+
+# Fast partnames must give each new image a unique partname, and the deck must save
+def test_add_slide_fast_partnames(get_prs, tmp_path):
+    prs = get_prs
+
+    def image_partnames():
+        return [
+            part.partname
+            for part in prs.part.package.iter_parts()
+            if part.partname.startswith("/ppt/media/image")
+        ]
+
+    num_template_images = len(image_partnames())
+    num_template_slides = len(prs.slides)
+
+    for i, colour in enumerate(["red", "green", "blue"]):
+        picture = str(tmp_path / f"img{i}.png")
+        Image.new("RGB", (20, 10), colour).save(picture)
+        sg.add_slide(
+            prs=prs,
+            layout_name="title_2pic_3txt",
+            title="Some Title",
+            pictures=[picture, sample_img_fname],
+            fast_partnames=True,
+        )
+
+    # Three new images plus the sample image, which is only stored once
+    partnames = image_partnames()
+    assert len(partnames) == num_template_images + 4
+    assert len(set(partnames)) == len(partnames)
+
+    output = tmp_path / "output.pptx"
+    prs.save(output)
+    assert len(Presentation(output).slides) == num_template_slides + 3
+
+
+# With cache_image_parts, the same picture on many slides must be stored once, and looked up once
+def test_add_slide_reuses_image_part(get_prs, monkeypatch):
+    prs = get_prs
+
+    image_parts = prs.part.package._image_parts
+    lookups = []
+    get_or_add_image_part = image_parts.get_or_add_image_part
+
+    def counted_get_or_add_image_part(image_file):
+        lookups.append(image_file)
+        return get_or_add_image_part(image_file)
+
+    monkeypatch.setattr(
+        image_parts, "get_or_add_image_part", counted_get_or_add_image_part
+    )
+
+    slide_ids = [
+        sg.add_slide(
+            prs=prs,
+            layout_name="title_2pic_3txt",
+            title="Some Title",
+            pictures=[sample_img_fname, sample_img_fname],
+            picture_scale_method=scale_method,
+            cache_image_parts=True,
+        )
+        for scale_method in ["fill_placeholder", "within_placeholder"]
+    ]
+
+    slide_image_parts = {
+        rel.target_part
+        for slide_id in slide_ids
+        for rel in prs.slides.get(slide_id).part.rels.values()
+        if rel.reltype == RT.IMAGE
+    }
+    assert len(slide_image_parts) == 1
+    assert len(lookups) == 1
+
+
+# A failed input check must not leave a new slide in the deck
+def test_add_slide_invalid_input_adds_no_slide(get_prs):
+    num_slides = len(get_prs.slides)
+    with pytest.raises(ValueError):
+        sg.add_slide(prs=get_prs, layout_name="no_placeholders", title="Some Title")
+    assert len(get_prs.slides) == num_slides
+
+
+# Without cache_image_parts, the package's image lookup must be left unchanged
+def test_add_slide_image_part_cache_opt_in(get_prs):
+    sg.add_slide(
+        prs=get_prs,
+        layout_name="title_2pic_3txt",
+        title="Some Title",
+        pictures=[sample_img_fname],
+    )
+    assert "get_or_add_image_part" not in vars(get_prs.part.package)
+
+
+
+# A call without cache_image_parts, after one with it, must read a rewritten picture file again
+def test_add_slide_image_part_cache_not_kept(get_prs, tmp_path):
+    prs = get_prs
+    # Bitmaps of the same dimensions are the same size, so the rewrite keeps path, size and mtime
+    picture = str(tmp_path / "chart.bmp")
+    Image.new("RGB", (20, 10), "red").save(picture)
+    mtime_ns = os.stat(picture).st_mtime_ns
+
+    slide_ids = []
+    for colour, cache_image_parts in [("red", True), ("blue", False)]:
+        Image.new("RGB", (20, 10), colour).save(picture)
+        os.utime(picture, ns=(mtime_ns, mtime_ns))
+        slide_ids.append(
+            sg.add_slide(
+                prs=prs,
+                layout_name="title_2pic_3txt",
+                title="Some Title",
+                pictures=[picture],
+                cache_image_parts=cache_image_parts,
+            )
+        )
+
+    slide_image_parts = {
+        rel.target_part
+        for slide_id in slide_ids
+        for rel in prs.slides.get(slide_id).part.rels.values()
+        if rel.reltype == RT.IMAGE
+    }
+    assert len(slide_image_parts) == 2
+    assert "get_or_add_image_part" not in vars(prs.part.package)
+
+
+# Fast partnames must not reuse a partname taken by a picture added without them
+def test_add_slide_fast_partnames_not_kept(get_prs, tmp_path):
+    prs = get_prs
+
+    for i, fast_partnames in enumerate([True, False, True]):
+        picture = str(tmp_path / f"img{i}.png")
+        Image.new("RGB", (20, 10), (i, 0, 0)).save(picture)
+        sg.add_slide(
+            prs=prs,
+            layout_name="title_2pic_3txt",
+            title="Some Title",
+            pictures=[picture],
+            fast_partnames=fast_partnames,
+        )
+
+    partnames = [part.partname for part in prs.part.package.iter_parts()]
+    assert len(set(partnames)) == len(partnames)
+    assert "next_image_partname" not in vars(prs.part.package)
+
+## FUNCTION add_slides_bulk ##
+# Must add one slide per spec, in the order given
+def test_add_slides_bulk_result(get_prs):
+    prs = get_prs
+    specs = [
+        sg.SlideSpec("title_2txt", title="Title 1", bodies=["text1"]),
+        sg.SlideSpec(
+            "title_2pic_3txt",
+            title="Title 2",
+            pictures=[sample_img_fname],
+            picture_scale_method="within_placeholder",
+        ),
+        sg.SlideSpec("title_2txt", title="Title 3", bodies=["text1", "text2"]),
+        sg.SlideSpec("no_placeholders"),
+    ]
+
+    slide_idxs = sg.add_slides_bulk(prs, specs)
+
+    assert len(slide_idxs) == len(specs)
+    assert slide_idxs == [slide.slide_id for slide in prs.slides][-len(specs) :]
+
+    titles = [prs.slides.get(slide_idx).shapes.title for slide_idx in slide_idxs]
+    assert [title.text for title in titles[:3]] == ["Title 1", "Title 2", "Title 3"]
+    assert titles[3] is None
+
+    placeholders = sg.get_slide_placeholders(prs.slides.get(slide_idxs[0]))
+    assert len(placeholders["body"]) == 1
+
+
+# Must accept a generator of specs, adding every slide
+def test_add_slides_bulk_generator(get_prs):
+    specs = [
+        sg.SlideSpec("title_only", title="Title 1"),
+        sg.SlideSpec("title_2pic_3txt", title="Title 2", pictures=[sample_img_fname]),
+        sg.SlideSpec("title_2txt", title="Title 3", bodies=["text1"]),
+    ]
+    num_slides = len(get_prs.slides)
+
+    slide_idxs = sg.add_slides_bulk(get_prs, (spec for spec in specs))
+
+    assert len(slide_idxs) == len(specs)
+    assert len(get_prs.slides) == num_slides + len(specs)
+
+
+# Must default bodies and pictures to none, as add_slide does, and accept None for them
+def test_add_slides_bulk_defaults(get_prs):
+    specs = [
+        sg.SlideSpec("title_2txt", title="Title 1"),
+        sg.SlideSpec("title_2txt", title="Title 2", bodies=None, pictures=None),
+    ]
+    slide_idxs = sg.add_slides_bulk(get_prs, specs)
+
+    for slide_idx in slide_idxs:
+        placeholders = sg.get_slide_placeholders(get_prs.slides.get(slide_idx))
+        assert placeholders.body == []
+
+
+# Must check each spec as add_slide does
+def test_add_slides_bulk_too_many_bodies(get_prs):
+    with pytest.raises(ValueError):
+        sg.add_slides_bulk(
+            get_prs, [sg.SlideSpec("title_only", title="Title", bodies=["text1"])]
+        )
+
+
+## FUNCTIONS validate_layout_inputs / add_slide_unchecked ##
+# Must return the layout index for valid inputs
+def test_validate_layout_inputs_valid(get_prs):
+    layout_idx = sg.validate_layout_inputs(
+        get_prs, "title_2txt", "Some Title", ["text1", "text2"]
+    )
+    assert layout_idx == 2
+
+
+# Must raise the same errors as add_slide, without adding a slide
+def test_validate_layout_inputs_invalid(get_prs):
+    num_slides = len(get_prs.slides)
+    with pytest.raises(ValueError):
+        sg.validate_layout_inputs(get_prs, "title_only", "Some Title", ["text1"])
+    with pytest.raises(TypeError):
+        sg.validate_layout_inputs(get_prs, "title_2txt", "Some Title", "text1")
+    assert len(get_prs.slides) == num_slides
+
+
+# Must give the same slide as add_slide
+def test_add_slide_unchecked_result(get_prs):
+    prs = get_prs
+    layout_idx = sg.validate_layout_inputs(
+        prs, "title_2pic_3txt", "Some Title", ["text1", "text2"], [sample_img_fname]
+    )
+    new_slide_idx = sg.add_slide_unchecked(
+        prs, layout_idx, "Some Title", ["text1", "text2"], [sample_img_fname]
+    )
+    slide = prs.slides.get(new_slide_idx)
+
+    assert slide.shapes.title.text == "Some Title"
+    assert sg.get_slide_placeholders(slide) == {
+        "title": 0,
+        "body": [15, 16],
+        "picture": [13],
+        "other": {},
+    }
+
+
+# A bad last spec must fail before any slide is added
+def test_add_slides_bulk_invalid_last_spec_adds_no_slides(get_prs):
+    num_slides = len(get_prs.slides)
+    specs = [
+        sg.SlideSpec("title_only", title="Title 1"),
+        sg.SlideSpec("title_2txt", title="Title 2", bodies=["text1"]),
+        sg.SlideSpec("title_only", title="Title 3", bodies=["text1"]),
+    ]
+    with pytest.raises(ValueError):
+        sg.add_slides_bulk(get_prs, specs)
+    assert len(get_prs.slides) == num_slides